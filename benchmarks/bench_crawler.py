@@ -0,0 +1,73 @@
+"""
+benchmarks FetchTweets against a local stand-in of the floodtags API
+
+usage: python benchmarks/bench_crawler.py [tags] [latency in ms]
+"""
+import datetime
+import gzip
+import json
+import sys
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import floodtags.api.crawler as crawler
+
+
+def make_handler(tags, latency):
+    """
+    creates a request handler that serves tags page by page
+    :param tags: list of tag dictionaries
+    :param latency: delay per request in seconds
+    :return: request handler class
+    """
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            query = urllib.parse.parse_qs(urllib.parse.urlsplit(self.path).query)
+            skip = int(query.get("skip", ["0"])[0])
+            limit = int(query.get("limit", ["100"])[0])
+            time.sleep(latency)
+            body = json.dumps({"tags": tags[skip:skip + limit]}).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            if "gzip" in self.headers.get("Accept-Encoding", ""):
+                body = gzip.compress(body)
+                self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def run(amount=20000, latency=0.02):
+    tags = [{"id": "t-" + str(i), "text": "flood " + str(i), "keywords": ["flood"]} for i in range(amount)]
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(tags, latency))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    config = crawler.APIConfig()
+    config.set_api_key("benchmark")
+    config.set_base_url("http://127.0.0.1:" + str(server.server_address[1]) + "/v1/tags/")
+    config.set_start_time(datetime.datetime.now() - datetime.timedelta(hours=6))
+    config.set_end_time(datetime.datetime.now())
+
+    for concurrency in (1, 2, 4, 8, 16):
+        config.set_concurrency(concurrency)
+        start = time.perf_counter()
+        result = crawler.FetchTweets(config).fetch()
+        elapsed = time.perf_counter() - start
+        assert [tag["id"] for tag in result] == [tag["id"] for tag in tags]
+        print("concurrency %2d: %6d tags in %.2fs (%.0f tags/s)" % (concurrency, len(result), elapsed,
+                                                                     len(result) / elapsed))
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    run(int(args[0]) if args else 20000, int(args[1]) / 1000 if len(args) > 1 else 0.02)
@@ -0,0 +1,46 @@
+"""
+compares reading demo files from json with reading them from the packed corpus
+
+usage: python benchmarks/bench_demo_corpus.py
+"""
+import json
+import os
+import time
+
+import floodtags.api.corpus as corpus
+
+
+def read_json(numbers):
+    result = []
+    for i in numbers:
+        with open(os.path.join(corpus.DEMO_DIRECTORY, "data" + str(i) + ".json"), encoding="utf8") as data_file:
+            result += json.load(data_file)
+    return result
+
+
+def read_packed(numbers):
+    packed = corpus.PackedCorpus(corpus.DEMO_CORPUS)
+    result = []
+    for i in numbers:
+        result += packed.get_file(i)
+    packed.close()
+    return result
+
+
+def run():
+    start = time.perf_counter()
+    corpus.pack(corpus.DEMO_DIRECTORY, corpus.DEMO_CORPUS)
+    print("packing: %.2fs (one time)" % (time.perf_counter() - start))
+    for name, numbers in (("one FakeAPI call", range(550, 545, -1)), ("whole demo run", range(550, -1, -1))):
+        start = time.perf_counter()
+        expected = read_json(numbers)
+        json_time = time.perf_counter() - start
+        start = time.perf_counter()
+        result = read_packed(numbers)
+        packed_time = time.perf_counter() - start
+        assert result == expected
+        print("%-16s json: %.4fs packed: %.4fs" % (name, json_time, packed_time))
+
+
+if __name__ == '__main__':
+    run()
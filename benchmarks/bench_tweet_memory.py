@@ -0,0 +1,71 @@
+"""
+measures the memory used by the Tweet objects of a 6 hour window of the demodata
+
+usage: python benchmarks/bench_tweet_memory.py [hours]
+"""
+import datetime
+import glob
+import json
+import os
+import sys
+import tracemalloc
+
+import floodtags.api.handler as handler
+
+
+class DictTweet(object):
+    """
+    the previous Tweet layout: the full API dictionary plus a parsed datetime
+    """
+    def __init__(self, tweet_json):
+        self.tweet = tweet_json
+        self.date = datetime.datetime.strptime(self.tweet["date"], "%Y-%m-%dT%H:%M:%S.000Z")
+        self.processed = False
+        self.max_importance = 0
+        self.language = None
+
+
+def load_window(hours):
+    """
+    loads the raw json of the tags of the last hours of the demodata
+    :param hours: size of the window
+    :return: list of json strings, one per tag
+    """
+    directory = os.path.join(os.path.dirname(os.path.abspath(handler.__file__)), "demodata")
+    tags = []
+    for path in glob.glob(os.path.join(directory, "data*.json")):
+        with open(path, encoding="utf8") as data_file:
+            tags += json.load(data_file)
+    last = max(tag["date"] for tag in tags)
+    end = datetime.datetime.strptime(last, "%Y-%m-%dT%H:%M:%S.000Z")
+    start = (end - datetime.timedelta(hours=hours)).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+    return [json.dumps(tag) for tag in tags if tag["date"] > start]
+
+
+def measure(make, raw):
+    """
+    measures the memory held by the objects make creates from freshly decoded tags
+    :param make: function that turns a tag dictionary into a tweet
+    :param raw: list of json strings
+    :return: (amount of bytes, list of tweets)
+    """
+    tracemalloc.start()
+    tweets = [make(json.loads(tag)) for tag in raw]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size, tweets
+
+
+def run(hours=6):
+    raw = load_window(hours)
+    print(len(raw), "tweets in a", hours, "hour window")
+    old, _ = measure(DictTweet, raw)
+    new, _ = measure(handler.Tweet, raw)
+    with_raw, _ = measure(lambda tag: handler.Tweet(tag, keep_raw=True), raw)
+    print("dictionary tweets: %8.1f KiB" % (old / 1024))
+    print("compact tweets:    %8.1f KiB (%.1fx smaller)" % (new / 1024, old / new))
+    print("compact with raw:  %8.1f KiB (%.1fx smaller)" % (with_raw / 1024, old / with_raw))
+
+
+if __name__ == '__main__':
+    run(*[int(arg) for arg in sys.argv[1:]])
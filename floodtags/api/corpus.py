@@ -0,0 +1,139 @@
+"""
+packs the demodata into a single binary corpus that is read through mmap
+
+layout of a packed corpus:
+    magic (8 bytes), amount of files F (uint32), amount of records R (uint32)
+    F + 1 uint32 values, the records of file i are record numbers [file[i], file[i + 1])
+    R + 1 uint64 values, the bytes of record j are [offset[j], offset[j + 1]) of the data
+    data, the compact json of each record followed by a comma, so a range of records is a json array without brackets
+"""
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+
+MAGIC = b"FTPACK01"
+HEADER = struct.Struct("<8sII")
+DEMO_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "demodata")
+DEMO_CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "demodata.pack")
+
+
+def pack(directory, path):
+    """
+    packs all dataN.json files in directory into a corpus
+    :param directory: directory containing the json files
+    :param path: location of the packed corpus
+    :return: None
+    """
+    numbers = [int(match.group(1)) for match in
+               (re.match(r"data(\d+)\.json$", name) for name in os.listdir(directory)) if match]
+    files = [0]
+    offsets = [0]
+    temp = path + ".tmp"
+    with open(temp + ".data", "wb") as data:
+        for number in range(max(numbers, default=-1) + 1):
+            if number in numbers:
+                with open(os.path.join(directory, "data" + str(number) + ".json"), encoding="utf8") as data_file:
+                    for tag in json.load(data_file):
+                        record = json.dumps(tag, separators=(",", ":")).encode("utf-8") + b","
+                        data.write(record)
+                        offsets.append(offsets[-1] + len(record))
+            files.append(len(offsets) - 1)
+    with open(temp, "wb") as corpus:
+        corpus.write(HEADER.pack(MAGIC, len(files) - 1, len(offsets) - 1))
+        corpus.write(struct.pack("<" + str(len(files)) + "I", *files))
+        corpus.write(struct.pack("<" + str(len(offsets)) + "Q", *offsets))
+        with open(temp + ".data", "rb") as data:
+            while True:
+                block = data.read(1 << 20)
+                if not block:
+                    break
+                corpus.write(block)
+    os.remove(temp + ".data")
+    os.replace(temp, path)
+
+
+class PackedCorpus(object):
+    """
+    read only access to a packed corpus, only the records that are asked for are decoded
+    """
+    def __init__(self, path):
+        """
+        constructor for PackedCorpus
+        :param path: location of the packed corpus
+        :return: None
+        """
+        with open(path, "rb") as corpus:
+            self.map = mmap.mmap(corpus.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.file_count, self.record_count = HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC:
+            raise ValueError("not a packed corpus: " + path)
+        self.files = HEADER.size
+        self.offsets = self.files + (self.file_count + 1) * 4
+        self.data = self.offsets + (self.record_count + 1) * 8
+
+    def __len__(self):
+        """
+        gets the amount of records
+        :return: amount of records
+        """
+        return self.record_count
+
+    def file_range(self, number):
+        """
+        gets the record numbers of a file
+        :param number: number of the original dataN.json file
+        :return: tuple (first record, last record + 1)
+        """
+        if not 0 <= number < self.file_count:
+            raise IndexError("no file " + str(number) + " in corpus")
+        return struct.unpack_from("<II", self.map, self.files + number * 4)
+
+    def get_records(self, start, end):
+        """
+        decodes records start up to end
+        :param start: number of the first record
+        :param end: number of the last record + 1
+        :return: list of tags
+        """
+        if start >= end:
+            return []
+        first, last = struct.unpack_from("<Q", self.map, self.offsets + start * 8)[0], \
+            struct.unpack_from("<Q", self.map, self.offsets + end * 8)[0]
+        # decode the whole range at once, the trailing comma of the last record is left out
+        return json.loads(b"[" + self.map[self.data + first:self.data + last - 1] + b"]")
+
+    def get_file(self, number):
+        """
+        decodes the records of an original dataN.json file
+        :param number: number of the file
+        :return: list of tags
+        """
+        return self.get_records(*self.file_range(number))
+
+    def close(self):
+        """
+        closes the memory map
+        :return: None
+        """
+        self.map.close()
+
+
+def load_demo():
+    """
+    opens the packed demodata, the corpus is packed first if it does not exist yet
+    :return: PackedCorpus or None if the corpus can not be written
+    """
+    try:
+        if not os.path.isfile(DEMO_CORPUS):
+            pack(DEMO_DIRECTORY, DEMO_CORPUS)
+        return PackedCorpus(DEMO_CORPUS)
+    except OSError:
+        return None
+
+
+if __name__ == '__main__':
+    # python -m floodtags.api.corpus [directory] [output]
+    pack(sys.argv[1] if len(sys.argv) > 1 else DEMO_DIRECTORY, sys.argv[2] if len(sys.argv) > 2 else DEMO_CORPUS)
@@ -2,59 +2,247 @@
 interacts with the floodtags api
 """
 import datetime
+import gzip
+import http.client
 import json
+import random
+import threading
 import urllib.error
-import urllib.request
+import urllib.parse
+from multiprocessing.pool import ThreadPool
 from time import sleep
 
+PAGE_SIZE = 100
+
+
+class ConnectionPool:
+    """
+    keeps a keep-alive connection to the API host for each worker thread
+    """
+    def __init__(self, base_url, size=1, timeout=60):
+        """
+        constructor for ConnectionPool
+        :param base_url: url of the API, only the scheme and host are used
+        :param size: maximum amount of requests in flight at the same time
+        :param timeout: socket timeout in seconds
+        :return: None
+        """
+        parts = urllib.parse.urlsplit(base_url)
+        self.secure = parts.scheme == "https"
+        self.host = parts.netloc
+        self.size = size
+        self.timeout = timeout
+        self.local = threading.local()
+        self.connections = []
+        self.lock = threading.Lock()
+        self.workers = None
+
+    def _connection(self):
+        """
+        gets the connection of the current thread, opens one if there is none
+        :return: HTTPConnection or HTTPSConnection
+        """
+        connection = getattr(self.local, "connection", None)
+        if connection is None:
+            if self.secure:
+                connection = http.client.HTTPSConnection(self.host, timeout=self.timeout)
+            else:
+                connection = http.client.HTTPConnection(self.host, timeout=self.timeout)
+            self.local.connection = connection
+            with self.lock:
+                self.connections.append(connection)
+        return connection
+
+    def _reset(self):
+        """
+        drops the connection of the current thread so the next request reconnects
+        :return: None
+        """
+        connection = getattr(self.local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self.local.connection = None
+            with self.lock:
+                self.connections.remove(connection)
+
+    def get(self, path):
+        """
+        requests path over the keep-alive connection of the current thread
+        :param path: path and query string of the request
+        :return: decoded response body
+        """
+        # a keep-alive connection can be closed by the server between requests, so reconnect once
+        for attempt in range(2):
+            connection = self._connection()
+            try:
+                connection.request("GET", path, headers={"Accept-Encoding": "gzip"})
+                response = connection.getresponse()
+                body = response.read()
+            except (http.client.HTTPException, ConnectionError):
+                self._reset()
+                if attempt:
+                    raise
+                continue
+            if response.getheader("Content-Encoding") == "gzip":
+                body = gzip.decompress(body)
+            if response.status != 200:
+                raise urllib.error.HTTPError(path, response.status, response.reason, response.headers, None)
+            return body.decode('utf-8')
+
+    def get_many(self, paths):
+        """
+        requests all paths with at most self.size requests in flight
+        :param paths: list of paths
+        :return: list of decoded response bodies, in the same order as paths
+        """
+        if self.size <= 1:
+            return [self.get(path) for path in paths]
+        if self.workers is None:
+            self.workers = ThreadPool(self.size)
+        return self.workers.map(self.get, paths)
+
+    def close(self):
+        """
+        closes the worker threads and all open connections
+        :return: None
+        """
+        if self.workers is not None:
+            self.workers.close()
+            self.workers.join()
+            self.workers = None
+        with self.lock:
+            for connection in self.connections:
+                connection.close()
+            self.connections = []
+
+
+class Backoff(object):
+    """
+    jittered exponential backoff with a budget for the total waiting time
+    """
+    def __init__(self, base=1, cap=300, budget=3600):
+        """
+        constructor for Backoff
+        :param base: maximum wait of the first retry in seconds
+        :param cap: maximum wait of a single retry in seconds
+        :param budget: maximum total waiting time in seconds
+        :return: None
+        """
+        self.base = base
+        self.cap = cap
+        self.budget = budget
+        self.attempt = 0
+        self.waited = 0
+
+    def wait(self):
+        """
+        sleeps before the next retry, the maximum wait doubles for each consecutive retry
+        :return: False if the budget does not allow another retry, otherwise True
+        """
+        delay = random.uniform(0, min(self.cap, self.base * 2 ** self.attempt))
+        if self.waited + delay > self.budget:
+            return False
+        sleep(delay)
+        self.waited += delay
+        self.attempt += 1
+        return True
+
+    def reset(self):
+        """
+        resets the wait time after a successful request, the waited time still counts towards the budget
+        :return: None
+        """
+        self.attempt = 0
+
 
 class FetchTweets:
     """
     class that calls the floodtags API
     """
-    def __init__(self, config):
+    def __init__(self, config, connections=None, spool=None, backoff=None):
         """
         constructor for FetchTweets
         :param config: APIConfig object which contains the information needed to make the API call
+        :param connections: ConnectionPool that is reused between calls, if left empty one is made for each fetch
+        :param spool: SpoolRange the pages are written to and resumed from, optional
+        :param backoff: Backoff used when the API fails, if left empty the default Backoff is used
         :return: None
         """
         self.config = config
+        self.connections = connections
+        self.spool = spool
+        self.backoff = backoff if backoff is not None else Backoff()
 
     def fetch(self):
         """
-        calls api
-        :return: tweets
+        calls api, requests config.get_concurrency() pages at the same time
+        pages that are already in the spool are read from disk instead
+        :return: tweets, in the order the API returns them
         """
-        urlbuilder = ["https://api.floodtags.com/v1/tags/",
+        result = []
+        for tags in self.fetch_pages():
+            result += tags
+        return result
+
+    def fetch_pages(self):
+        """
+        calls api and yields each page as soon as it is decoded
+        :return: generator of lists of tweets, in the order the API returns them
+        """
+        urlbuilder = [urllib.parse.urlsplit(self.config.get_base_url()).path,
                       self.config.get_filter(),
                       "/index?",
                       "omitRetweets=",
                       str(not self.config.get_retweets()).lower(),
                       "&apiKey=",
                       self.config.get_api_key(),
-                      "&limit=100"
+                      "&limit=" + str(PAGE_SIZE)
                       ]
 
         date = self.config.generate_range()
         base_url = "".join(urlbuilder)
-        result = []
+
+        connections = self.connections
+        if connections is None:
+            connections = ConnectionPool(self.config.get_base_url(), self.config.get_concurrency())
 
         temp = base_url + "&" + date + "&skip="
         index = 0
-        while True:
-            try:
-                response = urllib.request.urlopen(temp + str(index * 100))
-                response_string = response.read().decode('utf-8')
-                output = json.loads(response_string)
-                result += output["tags"]
-                # if there are no more tweets left to pull
-                if len(output["tags"]) < 100:
+        try:
+            while True:
+                # request a window of pages at once, a short page means the end has been reached
+                skips = [(index + i) * PAGE_SIZE for i in range(connections.size)]
+                pages = [self.spool.read_page(skip) if self.spool else None for skip in skips]
+                missing = [i for i in range(len(pages)) if pages[i] is None]
+                try:
+                    fetched = connections.get_many([temp + str(skips[i]) for i in missing])
+                except (OSError, http.client.HTTPException) as error:
+                    # wait for the API to come back, give up when the budget is spent
+                    if not self.backoff.wait():
+                        raise
+                    continue
+                self.backoff.reset()
+                for i, page in zip(missing, fetched):
+                    pages[i] = json.loads(page)["tags"]
+                    if self.spool:
+                        self.spool.write_page(skips[i], pages[i])
+                done = False
+                for tags in pages:
+                    yield tags
+                    # if there are no more tweets left to pull
+                    if len(tags) < PAGE_SIZE:
+                        done = True
+                        break
+                if done:
                     break
-                index += 1
-            except urllib.error.HTTPError as error:
-                # wait for the API to come back
-                sleep(300)
-        return result
+                index += len(pages)
+                if self.spool:
+                    self.spool.set_skip(index * PAGE_SIZE)
+            if self.spool:
+                self.spool.complete()
+        finally:
+            if self.connections is None:
+                connections.close()
 
 
 class APIConfig():
@@ -71,6 +259,8 @@ class APIConfig():
         self.start_date = None
         self.end_date = None
         self.filter = "flood"
+        self.base_url = "https://api.floodtags.com/v1/tags/"
+        self.concurrency = 1
 
     def set_api_key(self, key):
         """
@@ -149,6 +339,36 @@ class APIConfig():
         """
         return self.retweets
 
+    def set_base_url(self, url):
+        """
+        sets the url of the API, used to point the crawler at a different server
+        :param url: url up to and including /v1/tags/
+        :return: None
+        """
+        self.base_url = url
+
+    def get_base_url(self):
+        """
+        returns the url of the API
+        :return: url up to and including /v1/tags/
+        """
+        return self.base_url
+
+    def set_concurrency(self, concurrency: int):
+        """
+        sets how many pages are requested at the same time
+        :param concurrency: amount of requests in flight, 1 fetches the pages one by one
+        :return: None
+        """
+        self.concurrency = concurrency
+
+    def get_concurrency(self):
+        """
+        returns how many pages are requested at the same time
+        :return: amount of requests in flight
+        """
+        return self.concurrency
+
     def generate_range(self):
         """
         generates the date range used in the API call
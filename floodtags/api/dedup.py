@@ -0,0 +1,130 @@
+"""
+remembers which tweet ids have been seen so tweets that are fetched twice are dropped at ingest
+"""
+import hashlib
+import math
+
+
+class BloomFilter(object):
+    """
+    probabilistic set of strings, never gives false negatives, gives false positives at about error_rate
+    """
+    def __init__(self, capacity, error_rate=0.001):
+        """
+        constructor for BloomFilter
+        :param capacity: amount of keys the filter is sized for
+        :param error_rate: false positive rate when capacity keys have been added
+        :return: None
+        """
+        self.capacity = capacity
+        self.size = max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.hashes = max(1, int(round(self.size / capacity * math.log(2))))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key):
+        """
+        gets the bit positions of a key, double hashing on two halves of a blake2b digest
+        :param key: string
+        :return: generator of bit positions
+        """
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return ((first + i * second) % self.size for i in range(self.hashes))
+
+    def add(self, key):
+        """
+        adds a key to the filter
+        :param key: string
+        :return: None
+        """
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key):
+        """
+        checks if a key might have been added
+        :param key: string
+        :return: False if the key has certainly not been added, otherwise True
+        """
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    def is_full(self):
+        """
+        checks if the filter holds as many keys as it is sized for
+        :return: boolean
+        """
+        return self.count >= self.capacity
+
+
+class SeenIds(object):
+    """
+    ids of the recent tweets are kept in exact sets, older ids move to a limited amount of bloom filters
+    memory is bounded by window and filters * capacity, ids older than that are forgotten
+    """
+    def __init__(self, window=50000, capacity=500000, filters=4, error_rate=0.001):
+        """
+        constructor for SeenIds
+        :param window: amount of ids in each of the two exact generations
+        :param capacity: amount of ids per bloom filter
+        :param filters: amount of bloom filters that are kept
+        :param error_rate: false positive rate of each bloom filter
+        :return: None
+        """
+        self.window = window
+        self.capacity = capacity
+        self.filters = filters
+        self.error_rate = error_rate
+        self.current = set()
+        self.previous = set()
+        self.blooms = []
+        self.duplicates = 0
+
+    def __contains__(self, key):
+        """
+        checks if an id has been seen
+        :param key: tweet id
+        :return: boolean, can be a false positive for ids that are only in a bloom filter
+        """
+        if key in self.current or key in self.previous:
+            return True
+        return any(key in bloom for bloom in self.blooms)
+
+    def _rotate(self):
+        """
+        moves the previous generation into the newest bloom filter and starts a new generation
+        :return: None
+        """
+        if self.previous:
+            if not self.blooms or self.blooms[-1].is_full():
+                self.blooms.append(BloomFilter(self.capacity, self.error_rate))
+                if len(self.blooms) > self.filters:
+                    del self.blooms[0]
+            for key in self.previous:
+                self.blooms[-1].add(key)
+        self.previous = self.current
+        self.current = set()
+
+    def add(self, key):
+        """
+        adds an id
+        :param key: tweet id
+        :return: True if the id had not been seen yet, otherwise False
+        """
+        if key in self:
+            self.duplicates += 1
+            return False
+        if len(self.current) >= self.window:
+            self._rotate()
+        self.current.add(key)
+        return True
+
+    def filter(self, tags):
+        """
+        removes tags that have been seen, or that occur twice in tags
+        :param tags: list of tag dictionaries
+        :return: list of the new tags
+        """
+        return [tag for tag in tags if self.add(tag["source"]["id"])]
@@ -0,0 +1,154 @@
+"""
+reads tags from files incrementally so the size of a file does not decide the memory that is used
+
+supported layouts:
+    {"tags": [...]} (export of the API), [...] (demodata) and one tag per line (.ndjson / .jsonl)
+files ending in .gz are decompressed while they are read
+"""
+import gzip
+import json
+
+
+def open_text(path):
+    """
+    opens a file as text, gzip files are decompressed on the fly
+    :param path: location of the file
+    :return: text stream
+    """
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf8")
+    return open(path, encoding="utf8")
+
+
+def iter_tags(path, batch_size=1000):
+    """
+    reads the tags in a file in batches
+    :param path: location of the file
+    :param batch_size: maximum amount of tags per batch
+    :return: generator of lists of tags
+    """
+    name = path[:-3] if path.endswith(".gz") else path
+    with open_text(path) as stream:
+        if name.endswith(".ndjson") or name.endswith(".jsonl"):
+            tags = (json.loads(line) for line in stream if line.strip())
+        else:
+            tags = TagReader(stream).tags()
+        batch = []
+        for tag in tags:
+            batch.append(tag)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+
+class TagReader(object):
+    """
+    incremental parser for a json document that has the tags as top level array or in a top level "tags" key
+    """
+    def __init__(self, stream, chunk_size=1 << 16):
+        """
+        constructor for TagReader
+        :param stream: text stream containing the json document
+        :param chunk_size: amount of characters that are read at once
+        :return: None
+        """
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self):
+        """
+        reads the next chunk, the part of the buffer that has been parsed is dropped
+        :return: False if the end of the stream has been reached, otherwise True
+        """
+        if self.eof:
+            return False
+        chunk = self.stream.read(self.chunk_size)
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        if not chunk:
+            self.eof = True
+        return bool(chunk)
+
+    def _peek(self):
+        """
+        skips whitespace and gets the next character
+        :return: next character or None at the end of the stream
+        """
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return None
+
+    def _expect(self, characters):
+        """
+        consumes the next character, which has to be one of characters
+        :param characters: allowed characters
+        :return: the consumed character
+        """
+        char = self._peek()
+        if char is None or char not in characters:
+            raise ValueError("expected one of " + repr(characters) + " but found " + repr(char))
+        self.pos += 1
+        return char
+
+    def _value(self):
+        """
+        parses the next json value, more of the stream is read until the value is complete
+        :return: decoded value
+        """
+        self._peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+                # a number at the end of the buffer might continue in the next chunk
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self._fill()
+
+    def _array(self):
+        """
+        parses an array item by item
+        :return: generator of the items
+        """
+        self._expect("[")
+        if self._peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self._value()
+            if self._expect(",]") == "]":
+                return
+
+    def tags(self):
+        """
+        parses the document
+        :return: generator of tags
+        """
+        if self._peek() == "[":
+            yield from self._array()
+            return
+        self._expect("{")
+        if self._peek() == "}":
+            return
+        while True:
+            key = self._value()
+            self._expect(":")
+            if key == "tags":
+                yield from self._array()
+            else:
+                self._value()
+            if self._expect(",}") == "}":
+                return
@@ -1,60 +1,144 @@
 """handles interactions with the floodtags api and other data sources"""
+import calendar
 import datetime
 import json
-import re
+import sys
 from abc import ABCMeta
 
-import polyglot.detect
-
+import floodtags.api.corpus as corpus
 import floodtags.api.crawler as crawler
+import floodtags.api.dedup as dedup
+import floodtags.api.fileinput as fileinput
+import floodtags.api.replay as replay
+import floodtags.linguistics.language.detection as detection
 import os
 
 class APIHandler(object):
     """handles the api"""
-    def __init__(self, api):
+    def __init__(self, api, keep_raw=False, seen=None):
         """
         constructor for APIHandler
         :param api: class that interacts with the api
+        :param keep_raw: whether or not tweets keep their original dictionary, needed by formatters that output it
+        :param seen: SeenIds used to drop tweets that were fetched before, if left empty a new one is used
         :return: None
         """
         self.api = api
-        self.last = datetime.datetime.now() - datetime.timedelta(hours=240)
+        self.keep_raw = keep_raw
+        self.seen = seen if seen is not None else dedup.SeenIds()
+        self.last = self.api.get_resume_point()
+        if self.last is None:
+            self.last = datetime.datetime.now() - datetime.timedelta(hours=240)
+        self.pending = None
+        self.buffer = []
 
     def get_tweets(self):
         """
         fetches tweets and wraps them in Tweet objects
         :return: list of tweets
         """
-        now = datetime.datetime.now()
-        tweet_json = self.api.get_tweets(self.last, now)
-        self.last = now
-        return [Tweet(x) for x in tweet_json]
+        return [tweet for batch in self.stream_tweets() for tweet in batch]
+
+    def stream_tweets(self, batch_size=None):
+        """
+        fetches tweets and yields them as soon as each page is decoded
+        if the caller stops early, the next call continues with the tweets that were not yielded yet
+        :param batch_size: amount of tweets per batch, if left empty each page is a batch
+        :return: generator of lists of tweets
+        """
+        if self.pending is None:
+            now = datetime.datetime.now()
+            self.pending = self.api.stream_tweets(self.last, now)
+            self.last = now
+        while True:
+            if self.buffer and (batch_size is None or len(self.buffer) >= batch_size):
+                size = len(self.buffer) if batch_size is None else batch_size
+                batch = self.buffer[:size]
+                del self.buffer[:size]
+                yield batch
+                continue
+            page = next(self.pending, None)
+            if page is None:
+                self.pending = None
+                if self.buffer:
+                    batch = self.buffer
+                    self.buffer = []
+                    yield batch
+                return
+            # overlapping fetch windows and replays return tweets that are already known
+            self.buffer += [Tweet(x, self.keep_raw) for x in self.seen.filter(page)]
 
 
 class Tweet(object):
     """
-    wrapper for tweet dictionary
+    compact wrapper for tweet dictionary, only the fields used by the algorithm are kept
     """
-    def __init__(self, tweet_json):
+    __slots__ = ("id", "username", "text", "keywords", "photos", "date", "raw", "processed", "max_importance",
+                 "_language")
+
+    def __init__(self, tweet_json, keep_raw=False):
         """
         constructor for Tweet class
         :param tweet_json: tweet dictionary that needs to be wrapped
+        :param keep_raw: whether or not to keep the original dictionary as compact json bytes
         :return:
         """
-        self.tweet = tweet_json
-        self.date = datetime.datetime.strptime(self.tweet["date"], "%Y-%m-%dT%H:%M:%S.000Z")
+        self.id = tweet_json["source"]["id"]
+        self.username = sys.intern(tweet_json["source"]["username"])
+        self.text = tweet_json["text"]
+        self.keywords = tuple(sys.intern(keyword) for keyword in tweet_json["keywords"])
+        self.photos = len(tweet_json["photos"])
+        # seconds since epoch (UTC)
+        date = datetime.datetime.strptime(tweet_json["date"], "%Y-%m-%dT%H:%M:%S.000Z")
+        self.date = calendar.timegm(date.timetuple())
+        self.raw = json.dumps(tweet_json, separators=(",", ":")).encode("utf-8") if keep_raw else None
         self.processed = False
         self.max_importance = 0
-        try:
-            text = re.sub(self.tweet["keywords"][0], '', self.tweet["text"])
-        except IndexError:
-            text = self.tweet["text"]
-        try:
-            self.language = polyglot.detect.Detector(re.sub('#', '', text)).language.name
-        except polyglot.detect.base.UnknownLanguage as e:
-            self.language = "mixed"
-        except:
-            self.language = polyglot.detect.Detector(''.join([i if ord(i) < 128 else ' ' for i in text])).language.name
+        self._language = None
+
+    @property
+    def language(self):
+        """
+        language of the tweet according to polyglot, it is detected the first time it is needed
+        :return: language string
+        """
+        if self._language is None:
+            self._language = detection.DETECTOR.detect(self.text, self.get_keyword(), self.username)
+        return self._language
+
+    @language.setter
+    def language(self, language):
+        """
+        sets the language of the tweet
+        :param language: language string
+        :return: None
+        """
+        self._language = language
+
+    def has_language(self):
+        """
+        checks if the language has been detected already
+        :return: boolean containing whether or not the language is known
+        """
+        return self._language is not None
+
+    def get_keyword(self):
+        """
+        get the keyword the tweet was found with
+        :return: keyword or None if the tweet has no keywords
+        """
+        if self.keywords:
+            return self.keywords[0]
+        return None
+
+    def get_json(self):
+        """
+        get the original tweet dictionary, only available if the tweet was made with keep_raw
+        :return: tweet dictionary or None
+        """
+        if self.raw is None:
+            return None
+        return json.loads(self.raw.decode("utf-8"))
 
     def get_language(self):
         """
@@ -116,19 +200,53 @@ class AbstractAPI(object, metaclass=ABCMeta):
         """
         pass
 
+    def stream_tweets(self, start_date, end_date):
+        """
+        fetches tweets from start date till end date page by page
+        :param start_date: datetime that contains the starting point to gather tweets
+        :param end_date: datetime that contains the end point for gathering tweets
+        :return: generator of lists of tweets
+        """
+        yield self.get_tweets(start_date, end_date)
+
+    def get_resume_point(self):
+        """
+        gets the end of the last range fetched by a previous run
+        :return: datetime or None if there is nothing to resume
+        """
+        return None
+
 
 class API(AbstractAPI):
     """
     API class for getting tweets
     """
-    def __init__(self, region):
+    def __init__(self, region, fetchers=1, spool=None):
         """
         constructor for API
         :param region: datastream to be used
+        :param fetchers: amount of pages that are requested at the same time
+        :param spool: PageSpool the fetched pages are written to, optional
         :return: None
         """
+        self.fetchers = fetchers
+        self.connections = None
+        self.spool = spool
+        self.resumed = False
         super().__init__(region)
 
+    def get_resume_point(self):
+        """
+        gets the end of the last range fetched by a previous run
+        :return: datetime or None if there is nothing to resume
+        """
+        if self.spool is None:
+            return None
+        cursor = self.spool.get_cursor(self.region)
+        if cursor is None:
+            return None
+        return cursor["until"]
+
     def get_tweets(self, start_date, end_date):
         """
         fetches tweets from start date till end date
@@ -136,13 +254,45 @@ class API(AbstractAPI):
         :param end_date: datetime that contains the end point for gathering tweets
         :return: tweets
         """
+        return [tag for page in self.stream_tweets(start_date, end_date) for tag in page]
+
+    def stream_tweets(self, start_date, end_date):
+        """
+        fetches tweets from start date till end date page by page
+        :param start_date: datetime that contains the starting point to gather tweets
+        :param end_date: datetime that contains the end point for gathering tweets
+        :return: generator of lists of tweets
+        """
+        if self.spool is not None and not self.resumed:
+            # reuse what a previous run spooled and finish the range it was working on
+            self.resumed = True
+            cursor = self.spool.get_cursor(self.region)
+            yield self.spool.load_completed(self.region)
+            if cursor is not None and not cursor["complete"]:
+                yield from self._fetch_pages(cursor["since"], cursor["until"])
+        yield from self._fetch_pages(start_date, end_date)
+
+    def _fetch_pages(self, start_date, end_date):
+        """
+        fetches tweets from start date till end date from the api
+        :param start_date: datetime that contains the starting point to gather tweets
+        :param end_date: datetime that contains the end point for gathering tweets
+        :return: generator of lists of tweets
+        """
         # get tweets from api
         config = crawler.APIConfig()
         config.set_api_key("8e1618e9-419f-4239-a2ee-c0680740a500")
         config.set_end_time(end_date)
         config.set_filter(self.region)
         config.set_start_time(start_date)
-        return crawler.FetchTweets(config).fetch()
+        config.set_concurrency(int(self.fetchers))
+        # keep the connections open between calls
+        if self.connections is None:
+            self.connections = crawler.ConnectionPool(config.get_base_url(), config.get_concurrency())
+        spool_range = None
+        if self.spool is not None:
+            spool_range = self.spool.open_range(self.region, start_date, end_date)
+        return crawler.FetchTweets(config, self.connections, spool_range).fetch_pages()
 
 
 class FakeAPI(AbstractAPI):
@@ -156,6 +306,8 @@ class FakeAPI(AbstractAPI):
         :return: None
         """
         self.counter = 550
+        self.corpus = None
+        self.batch_size = 1000
         super().__init__(region)
 
     def get_tweets(self, start_date, end_date):
@@ -165,15 +317,99 @@ class FakeAPI(AbstractAPI):
         :param end_date: unused, is added to match the real API
         :return: tweets
         """
+        return [tag for page in self.stream_tweets(start_date, end_date) for tag in page]
+
+    def stream_tweets(self, start_date, end_date):
+        """
+        fetches tweets file by file, or in batches when reading a file
+        :param start_date: unused, is added to match the real API
+        :param end_date: unused, is added to match the real API
+        :return: generator of lists of tweets
+        """
         if self.region == "demo":
-            # use tweets from demo set
-            result = []
-            for i in range(self.counter, (self.counter - 5), -1):
-                with open(os.path.join(os.path.dirname(os.path.abspath(__file__)),'demodata/data' + str(i) + '.json'), encoding="utf8") as data_file:
-                    result += json.load(data_file)
+            # use tweets from demo set, read from the packed corpus when it is available
+            if self.corpus is None:
+                self.corpus = corpus.load_demo() or False
+            counter = self.counter
             self.counter -= 5
-            return result
+            for i in range(counter, (counter - 5), -1):
+                if self.corpus:
+                    yield self.corpus.get_file(i)
+                    continue
+                with open(os.path.join(os.path.dirname(os.path.abspath(__file__)),'demodata/data' + str(i) + '.json'), encoding="utf8") as data_file:
+                    yield json.load(data_file)
         else:
-            #use tweets form file
-            with open(self.region, encoding="utf8") as data_file:
-                return json.load(data_file)["tags"]
+            #use tweets form file, the file is parsed incrementally so only a batch of tags is decoded at a time
+            yield from fileinput.iter_tags(self.region, self.batch_size)
+
+
+class ReplayAPI(AbstractAPI):
+    """
+    API class that replays the demo data or a file as a stream, tags are served when their date is reached
+    """
+    def __init__(self, region, speed="max"):
+        """
+        constructor for ReplayAPI
+        :param region: "demo" or location of a file
+        :param speed: speed up of the replay (1 is real time) or "max" to serve all tags at once
+        :return: None
+        """
+        self.speed = speed
+        self.timeline = None
+        self.batch_size = 1000
+        super().__init__(region)
+
+    def _load(self):
+        """
+        reads all tags of the datasource
+        :return: list of tags
+        """
+        if self.region != "demo":
+            return [tag for batch in fileinput.iter_tags(self.region) for tag in batch]
+        demo = corpus.load_demo()
+        if demo:
+            return demo.get_records(0, len(demo))
+        tags = []
+        for name in os.listdir(corpus.DEMO_DIRECTORY):
+            if name.endswith(".json"):
+                with open(os.path.join(corpus.DEMO_DIRECTORY, name), encoding="utf8") as data_file:
+                    tags += json.load(data_file)
+        return tags
+
+    def get_tweets(self, start_date, end_date):
+        """
+        fetches the tweets that are due
+        :param start_date: unused, is added to match the real API
+        :param end_date: unused, is added to match the real API
+        :return: tweets
+        """
+        return [tag for page in self.stream_tweets(start_date, end_date) for tag in page]
+
+    def stream_tweets(self, start_date, end_date):
+        """
+        fetches the tweets that are due, if none are due this waits for the next one
+        :param start_date: unused, is added to match the real API
+        :param end_date: unused, is added to match the real API
+        :return: generator of lists of tweets
+        """
+        if self.timeline is None:
+            self.timeline = replay.Timeline(self._load(), self.speed)
+        tags = self.timeline.take()
+        for i in range(0, len(tags), self.batch_size):
+            yield tags[i:i + self.batch_size]
+
+    def get_lag(self):
+        """
+        gets how far behind the replay clock the tweets were fetched the last time
+        :return: seconds
+        """
+        if self.timeline is None:
+            return 0
+        return self.timeline.get_lag()
+
+    def is_finished(self):
+        """
+        checks if all tweets have been replayed
+        :return: boolean
+        """
+        return self.timeline is not None and self.timeline.is_finished()
@@ -0,0 +1,96 @@
+"""
+replays tags as a timestamped stream, the dates of the tags decide when they are served
+"""
+import bisect
+import calendar
+import datetime
+import time
+
+DATE_FORMAT = "%Y-%m-%dT%H:%M:%S.000Z"
+
+
+def parse_date(date):
+    """
+    converts the date of a tag to seconds since epoch
+    :param date: date string as given by the API
+    :return: seconds since epoch (UTC)
+    """
+    return calendar.timegm(datetime.datetime.strptime(date, DATE_FORMAT).timetuple())
+
+
+class Timeline(object):
+    """
+    serves tags in order of date, the replay clock runs speed times faster then the wall clock
+    """
+    def __init__(self, tags, speed="max", clock=time.monotonic, sleep=time.sleep):
+        """
+        constructor for Timeline
+        :param tags: list of tag dictionaries
+        :param speed: speed up of the replay (1 is real time) or "max" to serve all tags at once
+        :param clock: function giving the wall clock in seconds
+        :param sleep: function used to wait for the next tag
+        :return: None
+        """
+        self.tags = sorted(tags, key=lambda tag: tag["date"])
+        self.dates = [parse_date(tag["date"]) for tag in self.tags]
+        self.speed = None if str(speed) == "max" else float(speed)
+        self.clock = clock
+        self.sleep = sleep
+        self.started = None
+        self.position = 0
+        self.lag = 0
+
+    def __len__(self):
+        """
+        gets the amount of tags that have not been served yet
+        :return: amount of tags
+        """
+        return len(self.tags) - self.position
+
+    def stream_time(self):
+        """
+        gets the time of the replay clock
+        :return: seconds since epoch in stream time, None if the replay has not started
+        """
+        if self.started is None:
+            return None
+        if self.speed is None:
+            return float("inf")
+        return self.dates[0] + (self.clock() - self.started) * self.speed
+
+    def take(self, wait=True):
+        """
+        serves the tags that are due according to the replay clock, the first call starts the clock
+        :param wait: if nothing is due, sleep until the next tag is
+        :return: list of tags
+        """
+        if self.position >= len(self.tags):
+            return []
+        if self.started is None:
+            self.started = self.clock()
+        now = self.stream_time()
+        if wait and self.dates[self.position] > now:
+            self.sleep((self.dates[self.position] - now) / self.speed)
+            now = self.stream_time()
+        # how long the oldest tag that is served now has been waiting
+        self.lag = max(0, now - self.dates[self.position]) if self.speed is not None else 0
+        end = bisect.bisect_right(self.dates, now, self.position)
+        tags = self.tags[self.position:end]
+        self.position = end
+        return tags
+
+    def get_lag(self):
+        """
+        gets how far the consumer was behind the replay clock at the last take
+        :return: seconds of wall clock time
+        """
+        if self.speed is None:
+            return 0
+        return self.lag / self.speed
+
+    def is_finished(self):
+        """
+        checks if all tags have been served
+        :return: boolean
+        """
+        return self.position >= len(self.tags)
@@ -0,0 +1,168 @@
+"""
+stores fetched API pages on disk so a restarted crawler can resume where it stopped
+"""
+import datetime
+import json
+import os
+import urllib.parse
+
+DATE_FORMAT = "%Y%m%dT%H%M%S%f"
+
+
+class PageSpool(object):
+    """
+    on-disk spool of API pages, pages are stored per stream and per requested time range
+    """
+    def __init__(self, directory):
+        """
+        constructor for PageSpool
+        :param directory: directory the pages are written to
+        :return: None
+        """
+        self.directory = directory
+
+    def _stream_dir(self, stream):
+        """
+        gets the directory of a stream
+        :param stream: name of the datastream
+        :return: path of the directory
+        """
+        return os.path.join(self.directory, urllib.parse.quote(stream, safe=""))
+
+    def open_range(self, stream, start_date, end_date):
+        """
+        opens the spool for a time range and makes it the cursor of the stream
+        :param stream: name of the datastream
+        :param start_date: datetime containing the start of the range
+        :param end_date: datetime containing the end of the range
+        :return: SpoolRange object
+        """
+        spool_range = SpoolRange(self, stream, start_date, end_date)
+        cursor = self.get_cursor(stream)
+        if cursor is None or cursor["since"] != start_date or cursor["until"] != end_date:
+            spool_range.set_skip(0)
+        return spool_range
+
+    def get_cursor(self, stream):
+        """
+        gets the last range that was fetched for a stream
+        :param stream: name of the datastream
+        :return: dictionary with since, until, skip and complete or None if nothing was spooled
+        """
+        try:
+            with open(os.path.join(self._stream_dir(stream), "cursor.json"), encoding="utf8") as data_file:
+                cursor = json.load(data_file)
+        except (OSError, ValueError):
+            return None
+        cursor["since"] = datetime.datetime.strptime(cursor["since"], DATE_FORMAT)
+        cursor["until"] = datetime.datetime.strptime(cursor["until"], DATE_FORMAT)
+        return cursor
+
+    def set_cursor(self, stream, start_date, end_date, skip, complete=False):
+        """
+        persists the cursor of a stream
+        :param stream: name of the datastream
+        :param start_date: datetime containing the start of the range
+        :param end_date: datetime containing the end of the range
+        :param skip: skip value of the next page that needs to be fetched
+        :param complete: whether or not all pages of the range have been fetched
+        :return: None
+        """
+        cursor = {"since": start_date.strftime(DATE_FORMAT),
+                  "until": end_date.strftime(DATE_FORMAT),
+                  "skip": skip,
+                  "complete": complete}
+        _write_json(os.path.join(self._stream_dir(stream), "cursor.json"), cursor)
+
+    def load_completed(self, stream):
+        """
+        loads the tags of all ranges that have been fetched completely, oldest range first
+        :param stream: name of the datastream
+        :return: list of tags
+        """
+        directory = self._stream_dir(stream)
+        if not os.path.isdir(directory):
+            return []
+        result = []
+        for name in sorted(os.listdir(directory)):
+            path = os.path.join(directory, name)
+            if not os.path.isfile(os.path.join(path, "complete")):
+                continue
+            pages = sorted(int(page[:-5]) for page in os.listdir(path) if page.endswith(".json"))
+            for skip in pages:
+                with open(os.path.join(path, str(skip) + ".json"), encoding="utf8") as data_file:
+                    result += json.load(data_file)
+        return result
+
+
+class SpoolRange(object):
+    """
+    spool of a single time range of a stream
+    """
+    def __init__(self, spool, stream, start_date, end_date):
+        """
+        constructor for SpoolRange
+        :param spool: PageSpool the range belongs to
+        :param stream: name of the datastream
+        :param start_date: datetime containing the start of the range
+        :param end_date: datetime containing the end of the range
+        :return: None
+        """
+        self.spool = spool
+        self.stream = stream
+        self.start_date = start_date
+        self.end_date = end_date
+        self.directory = os.path.join(spool._stream_dir(stream),
+                                      start_date.strftime(DATE_FORMAT) + "_" + end_date.strftime(DATE_FORMAT))
+
+    def read_page(self, skip):
+        """
+        reads a page that was spooled before
+        :param skip: skip value of the page
+        :return: list of tags or None if the page is not on disk
+        """
+        try:
+            with open(os.path.join(self.directory, str(skip) + ".json"), encoding="utf8") as data_file:
+                return json.load(data_file)
+        except (OSError, ValueError):
+            return None
+
+    def write_page(self, skip, tags):
+        """
+        writes a page to disk
+        :param skip: skip value of the page
+        :param tags: list of tags in the page
+        :return: None
+        """
+        _write_json(os.path.join(self.directory, str(skip) + ".json"), tags)
+
+    def set_skip(self, skip):
+        """
+        moves the cursor of the stream to skip
+        :param skip: skip value of the next page that needs to be fetched
+        :return: None
+        """
+        self.spool.set_cursor(self.stream, self.start_date, self.end_date, skip)
+
+    def complete(self):
+        """
+        marks the range as completely fetched
+        :return: None
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        open(os.path.join(self.directory, "complete"), "w").close()
+        self.spool.set_cursor(self.stream, self.start_date, self.end_date, 0, True)
+
+
+def _write_json(path, data):
+    """
+    writes data as json to path, the file is replaced at once so it is never half written
+    :param path: location of the file
+    :param data: data that needs to be written
+    :return: None
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp = path + ".tmp"
+    with open(temp, "w", encoding="utf8") as data_file:
+        json.dump(data, data_file)
+    os.replace(temp, path)
@@ -4,7 +4,9 @@ module handling the creation of classes.
 import inspect
 import os
 
+import floodtags.api.dedup
 import floodtags.api.handler
+import floodtags.api.spool
 import floodtags.core.formatOutput
 import floodtags.datascience.analysis
 import floodtags.datascience.clustering.clustering
@@ -66,9 +68,38 @@ class Container:
             self.container.append(("api", floodtags.api.handler.FakeAPI, ("region",)))
             self.container.append(("region", input, None))
         else:
-            self.container.append(("api", floodtags.api.handler.API, ("region",)))
+            self.container.append(("api", floodtags.api.handler.API, ("region", "fetchers", "spool")))
             self.container.append(("region", input, None))
 
+    def set_replay(self, speed):
+        """
+        replay the input as a stream instead of reading it at once, only works for "demo" or a file
+        :param speed: speed up of the replay (1 is real time) or "max"
+        :return: None
+        """
+        self.container = [(a, b, c) for a, b, c in self.container if a not in ("api", "replayspeed")]
+        self.container.append(("api", floodtags.api.handler.ReplayAPI, ("region", "replayspeed")))
+        self.container.append(("replayspeed", speed, None))
+
+    def set_fetchers(self, fetchers):
+        """
+        how many API pages are requested at the same time
+        :param fetchers: amount of requests in flight
+        :return: None
+        """
+        self.container = [(a, b, c) for a, b, c in self.container if a != "fetchers"]
+        self.container.append(("fetchers", fetchers, None))
+
+    def set_spool(self, directory):
+        """
+        set where fetched API pages are stored so a restart can resume from them
+        :param directory: directory for the spool
+        :return: None
+        """
+        self.container = [(a, b, c) for a, b, c in self.container if a != "spool"]
+        self.container.append(("spool", floodtags.api.spool.PageSpool, ("spooldir",)))
+        self.container.append(("spooldir", directory, None))
+
     def set_location(self, location):
         """
         set location of output file
@@ -112,7 +143,9 @@ class Container:
         :return: None
         """
         self.container = [
-            ("handler", floodtags.api.handler.APIHandler, ("api",)),
+            ("handler", floodtags.api.handler.APIHandler, ("api", "keepraw", "seenids")),
+            ("keepraw", False, None),
+            ("seenids", floodtags.api.dedup.SeenIds, None),
             ("analysis", floodtags.datascience.analysis.AnalyzeDataSet, None),
             ("blacklist", floodtags.linguistics.language.wordlists.WordList, ("blacklistfile",)),
             ("blacklistfile", "linguistics/language/english/blacklist.txt", None),
@@ -122,6 +155,8 @@ class Container:
             ("warnlistfile", "linguistics/language/english/warningsystem.txt", None),
             ("clustering", floodtags.datascience.clustering.clustering.BisectingKmeansFun, ("cores",)),
             ("cores", 4, None),
+            ("fetchers", 1, None),
+            ("spool", None, None),
             ("filtering", floodtags.datascience.filtering.filtering.Filter, None),
             ("bannedusers", floodtags.linguistics.language.wordlists.WordList, ("banneduserfile",)),
             ("banneduserfile", "linguistics/language/bannedusers.txt", None),
@@ -131,8 +131,7 @@ class FormatResult(AbstractFormatter):
             temp = self.clusters[self.order[i][0]].get_five_latest()
             for j in range(0, len(temp)):
                 result.append(
-                    "{\"id\" : \"" + temp[j].tweet["source"]["id"] + "\",\"username\" : \"" + temp[j].tweet["source"][
-                        "username"] + "\"}")
+                    "{\"id\" : \"" + temp[j].id + "\",\"username\" : \"" + temp[j].username + "\"}")
                 result.append(",")
             del result[-1]
             result.append("]}")
@@ -147,16 +146,15 @@ class FormatResult(AbstractFormatter):
         :return: JSON representation of the 5 latest news tweets
         """
         result = ["["]
-        newstweets = [tweet for tweet in self.tweets if tweet.tweet["source"]["username"] in self.accounts]
+        newstweets = [tweet for tweet in self.tweets if tweet.username in self.accounts]
         sorted(newstweets, key=lambda tweet: tweet.date, reverse=True)
         amount = 5
         if len(newstweets) < amount:
             amount = len(newstweets)
         for i in range(amount):
             result.append(
-                "{\"id\" : \"" + newstweets[i].tweet["source"]["id"] + "\",\"username\" : \"" +
-                newstweets[i].tweet["source"][
-                    "username"] + "\"}")
+                "{\"id\" : \"" + newstweets[i].id + "\",\"username\" : \"" +
+                newstweets[i].username + "\"}")
             result.append(",")
         del result[-1]
         result.append("]")
@@ -214,8 +212,8 @@ class RatingFormat(AbstractFormatter):
             found = False
             for cluster in self.clusters:
                 for tweet in cluster.get_tweets():
-                    if ori.tweet["source"]["id"] == tweet.tweet["source"]["id"]:
-                        result.append("{\"id\" : \"" + str(tweet.tweet["source"]["id"]) + "\", \"importance\" : " + str(
+                    if ori.id == tweet.id:
+                        result.append("{\"id\" : \"" + str(tweet.id) + "\", \"importance\" : " + str(
                             tweet.get_importance()) + "}")
                         result.append(",")
                         found = True
@@ -223,7 +221,7 @@ class RatingFormat(AbstractFormatter):
                 if found:
                     break
             if not found:
-                result.append("{\"id\" : \"" + str(ori.tweet["source"]["id"]) + "\", \"importance\" : " + str(
+                result.append("{\"id\" : \"" + str(ori.id) + "\", \"importance\" : " + str(
                     ori.get_importance()) + "}")
                 result.append(",")
 
@@ -268,13 +266,13 @@ class ClusterFormat(AbstractFormatter):
             found = False
             for cluster in self.clusters:
                 for tweet in cluster.get_tweets():
-                    if ori.tweet["source"]["id"] == tweet.tweet["source"]["id"]:
+                    if ori.id == tweet.id:
                         found = True
                         break
                 if found:
                     break
             if not found:
-                spam.append(str(ori.tweet["source"]["id"]))
+                spam.append(str(ori.id))
         for i in range(len(self.clusters)):
             clust = ["{\"id\" : \""]
             clust.append(str(uuid.uuid4()))
@@ -287,7 +285,7 @@ class ClusterFormat(AbstractFormatter):
             clust.append(self.clusters[self.order[i][0]].lcs.replace("\"", "\\\"").replace("\r\n", "").replace("\r","").replace("\n",""))
             clust.append("\", \"ids\" : [")
             for tweet in self.clusters[self.order[i][0]].get_tweets():
-                clust.append(str(tweet.tweet["source"]["id"]))
+                clust.append(str(tweet.id))
                 clust.append(",")
             del clust[-1]
             clust.append("]}")
@@ -338,6 +336,6 @@ class TestFormat(AbstractFormatter):
             writer.write("-" * 79 + "\n")
             tweets = self.clusters[self.order[i][0]].get_tweets()
             for tweet in tweets:
-                writer.write(tweet.tweet["text"] + "\n")
+                writer.write(tweet.text + "\n")
                 writer.write("-" * 79 + "\n")
         writer.close()
@@ -0,0 +1,109 @@
+"""
+runs the steps of the algorithm as stages with their own thread, connected by bounded queues
+"""
+import queue
+import threading
+from collections import OrderedDict
+
+_DONE = object()
+
+
+class Stage(object):
+    """
+    a step of the pipeline, items from the inbox are handled one by one by a long lived thread
+    """
+    def __init__(self, name, function, size):
+        """
+        constructor for Stage
+        :param name: name of the stage
+        :param function: function that handles an item, its result is passed to the next stage unless it is None
+        :param size: maximum amount of items waiting in the inbox
+        :return: None
+        """
+        self.name = name
+        self.function = function
+        self.inbox = queue.Queue(size)
+        self.outbox = None
+        self.thread = None
+        self.processed = 0
+
+    def run(self, pipeline):
+        """
+        handles items until the end of the input is reached
+        :param pipeline: Pipeline the stage belongs to, errors are reported to it
+        :return: None
+        """
+        while True:
+            item = self.inbox.get()
+            if item is _DONE:
+                break
+            if pipeline.error is not None:
+                # keep draining so the stages before this one do not block
+                continue
+            try:
+                result = self.function(item)
+            except Exception as e:
+                pipeline.error = e
+                continue
+            self.processed += 1
+            if self.outbox is not None and result is not None:
+                self.outbox.put(result)
+        if self.outbox is not None:
+            self.outbox.put(_DONE)
+
+
+class Pipeline(object):
+    """
+    chain of stages, the thread calling run feeds the first stage
+    while a stage is busy the stage before it can already work on the next item, until its queue is full
+    """
+    def __init__(self, size=1):
+        """
+        constructor for Pipeline
+        :param size: maximum amount of items waiting between two stages
+        :return: None
+        """
+        self.size = size
+        self.stages = []
+        self.error = None
+
+    def add_stage(self, name, function):
+        """
+        adds a stage at the end of the pipeline
+        :param name: name of the stage
+        :param function: function that handles an item, its result is passed to the next stage unless it is None
+        :return: None
+        """
+        stage = Stage(name, function, self.size)
+        if self.stages:
+            self.stages[-1].outbox = stage.inbox
+        self.stages.append(stage)
+
+    def queue_depths(self):
+        """
+        gets the amount of items waiting for each stage
+        :return: OrderedDict of stage name to amount of items
+        """
+        return OrderedDict((stage.name, stage.inbox.qsize()) for stage in self.stages)
+
+    def run(self, source):
+        """
+        feeds the items of source through the stages and waits until all of them are handled
+        :param source: iterable of items for the first stage, it is consumed in the calling thread
+        :return: None
+        """
+        self.error = None
+        for stage in self.stages:
+            stage.thread = threading.Thread(target=stage.run, args=(self,), name=stage.name, daemon=True)
+            stage.thread.start()
+        try:
+            for item in source:
+                if self.error is not None:
+                    break
+                self.stages[0].inbox.put(item)
+        finally:
+            self.stages[0].inbox.put(_DONE)
+            for stage in self.stages:
+                stage.thread.join()
+        if self.error is not None:
+            raise self.error
@@ -4,6 +4,8 @@ analyzes the tweets to find which language the dataset is and what keyword is th
 from random import randrange
 from collections import Counter
 
+from floodtags.datascience.frame import TweetFrame
+
 
 class AnalyzeDataSet(object):
     """
@@ -29,12 +31,11 @@ class AnalyzeDataSet(object):
         starts analysis of the dataset
         :return: tuple containing the most frequent keyword and language (keyword, language)
         """
-        try:
-            keywords = [tweet.tweet["keywords"][0] for tweet in self.data]
-        except IndexError:
-            keywords = ["flood"]
+        keyword = TweetFrame(self.data).majority_keyword()
+        if keyword is None:
+            keyword = "flood"
         languages = self.get_lang()
-        return (self.most_common(keywords), self.most_common(languages))
+        return (keyword, self.most_common(languages))
 
     def get_lang(self):
         """
@@ -68,7 +69,7 @@ class AnalyzeDataSet(object):
             while True:
                 rnd = randrange(0, len(self.data))
                 if self.data[rnd] not in random_selection:
-                    if len(self.data[rnd].tweet["text"].split()) > 3:
+                    if len(self.data[rnd].text.split()) > 3:
                         random_selection.append(self.data[rnd])
                         break
 
@@ -93,10 +93,10 @@ class Vectorizer:
         reply_pattern = re.compile("^@([a-zA-Z0-9]*) (.*)")
         regexhandler = regex.RegexHandler()
         # add mark if tweets starts with a mention (@user)
-        if reply_pattern.match(tweet.tweet["text"]) is not None:
-            temp = "MarkReply " + tweet.tweet["text"]
+        if reply_pattern.match(tweet.text) is not None:
+            temp = "MarkReply " + tweet.text
         else:
-            temp = tweet.tweet["text"]
+            temp = tweet.text
         # language dependent
 
         if floodtags.core.statics.StaticData.locations:
@@ -108,8 +108,8 @@ class Vectorizer:
             stemmer = SnowballStemmer(floodtags.core.statics.StaticData.language.lower())
             # stem words
             temp = " ".join(
-                [stemmer.stem(x) if x not in tweet.tweet[
-                    "keywords"] and "MarkReply" not in x and "MarkLocation" not in x else x for x in temp.split()])
+                [stemmer.stem(x) if x not in tweet.keywords and "MarkReply" not in x and "MarkLocation" not in x else x
+                 for x in temp.split()])
         except ValueError:
             print("language not found:", floodtags.core.statics.StaticData.language)
             # pass
@@ -122,7 +122,7 @@ class Vectorizer:
         # replace each website with 'MarkWebsite' to create more similarity
         temp = regexhandler.replace(temp, 'MarkWebsite', regex.Expressions.website)
         # replace each photo url with 'MarkPhoto' to create more similarity
-        for i in range(len(tweet.tweet["photos"])):
+        for i in range(tweet.photos):
             temp = Vectorizer.rreplace(temp, "MarkWebsite", "MarkPhoto", 1)
         # replace each height with 'MarkHeight' to create more similarity
         temp = regexhandler.replace(temp, "MarkHeight", regex.Expressions.waterheight)
@@ -144,7 +144,7 @@ class Vectorizer:
             for i in range(len(results)):
                 temp += " MarkHashTag"
         # add sender as feature
-        temp = "Sender" + tweet.tweet["source"]["username"] + " " + temp
+        temp = "Sender" + tweet.username + " " + temp
         # remove unnecessary characters and chance text to lower case
         return re.sub('[#\.,:]', '', temp)
 
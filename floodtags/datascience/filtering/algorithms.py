@@ -25,7 +25,7 @@ class LongestCommonSubstring():
         text = []
         regexhandler = regex.RegexHandler()
         for tweet in cluster.get_tweets():
-            text.append(regexhandler.replace(tweet.tweet["text"],"",regex.Expressions.website))
+            text.append(regexhandler.replace(tweet.text,"",regex.Expressions.website))
         lcs = floodtags.linguistics.nlcs.lcs.LongestCommonString()
         return lcs.lmcs(text)
 
@@ -37,7 +37,7 @@ class LongestCommonSubstring():
         """
         usernames = []
         for tweet in cluster.get_tweets():
-            usernames.append(tweet.tweet["source"]["username"])
+            usernames.append(tweet.username)
         lcs = floodtags.linguistics.nlcs.lcs.LongestCommonString()
         return lcs.lmcs(usernames)
 
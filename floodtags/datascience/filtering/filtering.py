@@ -81,7 +81,7 @@ class ClusterAnalysis(object):
                 # top 5 words is stored as lcs
                 words = []
                 for tweet in cluster.get_tweets():
-                    words += [word.lower() for word in tweet.tweet["text"].split() if len(word) > 3]
+                    words += [word.lower() for word in tweet.text.split() if len(word) > 3]
                 count = Counter(words)
                 flcs = []
                 for word in count.most_common(word_count):
@@ -94,7 +94,7 @@ class ClusterAnalysis(object):
             # top 10 words is stored as lcs
             words = []
             for tweet in cluster.get_tweets():
-                words += [word.lower() for word in tweet.tweet["text"].split() if len(word) > 3]
+                words += [word.lower() for word in tweet.text.split() if len(word) > 3]
             count = Counter(words)
             flcs = []
             for word in count.most_common(word_count):
@@ -144,10 +144,10 @@ class TweetAnalysis():
         res = 1.0
         if tweet.language != self.language:
             return res
-        if self.keyword in tweet.tweet["keywords"]:
+        if self.keyword in tweet.keywords:
             res *= 1.01
-        if tweet.tweet["photos"]:
+        if tweet.photos:
             res *= 1.02
-        if self.regex_handler.exists(tweet.tweet["text"], regex.Expressions.waterheight):
+        if self.regex_handler.exists(tweet.text, regex.Expressions.waterheight):
             res *= 1.05
         return res
@@ -0,0 +1,190 @@
+"""
+columnar storage of tweets for operations on a whole time window
+"""
+import numpy as np
+
+
+class Vocabulary(object):
+    """
+    maps strings to integer codes
+    """
+    def __init__(self):
+        """
+        constructor for Vocabulary
+        :return: None
+        """
+        self.codes = {}
+        self.names = []
+
+    def code(self, name):
+        """
+        gets the code of a string, unknown strings get a new code
+        :param name: string that needs to be coded, None is coded as -1
+        :return: integer code
+        """
+        if name is None:
+            return -1
+        code = self.codes.get(name)
+        if code is None:
+            code = len(self.names)
+            self.codes[name] = code
+            self.names.append(name)
+        return code
+
+
+class TweetFrame(object):
+    """
+    stores tweets as NumPy columns sorted on date, slices of the frame share the arrays of the frame
+    """
+    def __init__(self, tweets=None):
+        """
+        constructor for TweetFrame
+        :param tweets: tweets the frame starts with, optional
+        :return: None
+        """
+        self.tweets = np.empty(0, dtype=object)
+        self.dates = np.empty(0, dtype=np.int64)
+        self.users = np.empty(0, dtype=np.int32)
+        self.languages = np.empty(0, dtype=np.int16)
+        self.keywords = np.empty(0, dtype=np.int32)
+        self.user_names = Vocabulary()
+        self.language_names = Vocabulary()
+        self.keyword_names = Vocabulary()
+        if tweets is not None:
+            self.extend(tweets)
+
+    def __len__(self):
+        """
+        gets the amount of tweets in the frame
+        :return: amount of tweets
+        """
+        return len(self.tweets)
+
+    def __iter__(self):
+        """
+        iterates over the tweets in order of date
+        :return: iterator of tweets
+        """
+        return iter(self.tweets)
+
+    def _view(self, rows):
+        """
+        creates a frame of a selection of rows, the vocabularies are shared
+        :param rows: slice (gives views of the columns) or index array/mask (gives copies)
+        :return: TweetFrame
+        """
+        frame = TweetFrame.__new__(TweetFrame)
+        frame.tweets = self.tweets[rows]
+        frame.dates = self.dates[rows]
+        frame.users = self.users[rows]
+        frame.languages = self.languages[rows]
+        frame.keywords = self.keywords[rows]
+        frame.user_names = self.user_names
+        frame.language_names = self.language_names
+        frame.keyword_names = self.keyword_names
+        return frame
+
+    def extend(self, tweets):
+        """
+        adds tweets to the frame
+        :param tweets: list of tweets
+        :return: None
+        """
+        if len(tweets) == 0:
+            return
+        new_tweets = np.empty(len(tweets), dtype=object)
+        new_tweets[:] = list(tweets)
+        dates = np.fromiter((tweet.date for tweet in tweets), dtype=np.int64, count=len(tweets))
+        users = np.fromiter((self.user_names.code(tweet.username) for tweet in tweets), dtype=np.int32,
+                            count=len(tweets))
+        languages = np.fromiter((self.language_names.code(tweet.language if tweet.has_language() else None)
+                                 for tweet in tweets), dtype=np.int16, count=len(tweets))
+        keywords = np.fromiter((self.keyword_names.code(tweet.get_keyword()) for tweet in tweets), dtype=np.int32,
+                               count=len(tweets))
+        self.tweets = np.concatenate((self.tweets, new_tweets))
+        self.dates = np.concatenate((self.dates, dates))
+        self.users = np.concatenate((self.users, users))
+        self.languages = np.concatenate((self.languages, languages))
+        self.keywords = np.concatenate((self.keywords, keywords))
+        # keep the rows sorted on date so a time window is a slice
+        if np.any(self.dates[1:] < self.dates[:-1]):
+            order = np.argsort(self.dates, kind="stable")
+            self.tweets = self.tweets[order]
+            self.dates = self.dates[order]
+            self.users = self.users[order]
+            self.languages = self.languages[order]
+            self.keywords = self.keywords[order]
+
+    def refresh_languages(self):
+        """
+        stores the languages of tweets that have been detected since they were added
+        :return: None
+        """
+        for i in np.flatnonzero(self.languages < 0):
+            if self.tweets[i].has_language():
+                self.languages[i] = self.language_names.code(self.tweets[i].language)
+
+    def max_date(self):
+        """
+        gets the date of the newest tweet
+        :return: seconds since epoch or 0 if the frame is empty
+        """
+        if len(self.dates) == 0:
+            return 0
+        return int(self.dates[-1])
+
+    def window(self, minutes, end=None):
+        """
+        selects the tweets newer then end minus minutes
+        :param minutes: size of the window in minutes
+        :param end: end of the window in seconds since epoch, if left empty the newest tweet is used
+        :return: TweetFrame sharing the columns of this frame
+        """
+        if end is None:
+            end = self.max_date()
+        start = np.searchsorted(self.dates, end - minutes * 60, side="right")
+        return self._view(slice(start, len(self.dates)))
+
+    def select(self, mask):
+        """
+        selects the rows where mask is True
+        :param mask: boolean array
+        :return: TweetFrame containing copies of the selected rows
+        """
+        return self._view(mask)
+
+    def user_counts(self):
+        """
+        counts the tweets of each user
+        :return: dictionary of username to amount of tweets
+        """
+        counts = np.bincount(self.users, minlength=len(self.user_names.names))
+        names = self.user_names.names
+        return {names[i]: int(counts[i]) for i in np.flatnonzero(counts)}
+
+    @staticmethod
+    def _majority(codes, vocabulary):
+        """
+        gets the most frequent code
+        :param codes: array of codes, -1 is ignored
+        :param vocabulary: Vocabulary the codes belong to
+        :return: most frequent string or None if there are no codes
+        """
+        codes = codes[codes >= 0]
+        if len(codes) == 0:
+            return None
+        return vocabulary.names[int(np.argmax(np.bincount(codes)))]
+
+    def majority_language(self):
+        """
+        gets the most frequent language among the tweets that have a detected language
+        :return: language or None
+        """
+        return self._majority(self.languages, self.language_names)
+
+    def majority_keyword(self):
+        """
+        gets the most frequent keyword
+        :return: keyword or None
+        """
+        return self._majority(self.keywords, self.keyword_names)
@@ -2,6 +2,7 @@
 Module used to find and categorize frequent tweeters into newsaccounts, warningaccounts and spamaccounts
 """
 import floodtags.datascience.clustering.singledimension as jenks
+from floodtags.datascience.frame import TweetFrame
 
 import floodtags.linguistics.sanitizing.regexhandler as rh
 
@@ -9,24 +10,16 @@ import floodtags.linguistics.sanitizing.regexhandler as rh
 def frequent_tweeter_analysis(tweets, newslist, warninglist):
     """
     finds frequent tweeters and seperates them into newsaccounts, warningaccounts and spamaccounts
-    :param tweets: tweets that need to be analyzed
+    :param tweets: TweetFrame or list of tweets that need to be analyzed
     :param newslist: Whitelist object containing the whitelist for news account names
     :param warninglist: Whitelist object containing the whitelist for warning words
     :return: tuple containing the usernames of (newsaccounts, warningaccounts, spamacounts)
     """
     jenksnb = jenks.JenksNaturalBreak()
 
-    total = {}
-    counter = 0
-
-    def add_user(username):
-        if username not in total:
-            total[username] = 0
-        total[username] += 1
-
-    for tweet in tweets:
-        add_user(tweet.tweet["source"]["username"])
-        counter += 1
+    if not isinstance(tweets, TweetFrame):
+        tweets = TweetFrame(tweets)
+    total = tweets.user_counts()
 
     tweetings = []
     for key in total.keys():
@@ -63,15 +56,15 @@ def frequent_tweeter_analysis(tweets, newslist, warninglist):
 
     warningaccount = []
     for tweet in tweets:
-        if tweet.tweet["source"]["username"] in other:
-            if "flood" in tweet.tweet["text"].lower():
-                if warninglist.match(tweet.tweet["text"]):
-                    warningaccount.append(tweet.tweet["source"]["username"])
-                    other.remove(tweet.tweet["source"]["username"])
+        if tweet.username in other:
+            if "flood" in tweet.text.lower():
+                if warninglist.match(tweet.text):
+                    warningaccount.append(tweet.username)
+                    other.remove(tweet.username)
                     continue
-                if regexhandler.exists(tweet.tweet["text"], rh.Expressions.time):
-                    warningaccount.append(tweet.tweet["source"]["username"])
-                    other.remove(tweet.tweet["source"]["username"])
+                if regexhandler.exists(tweet.text, rh.Expressions.time):
+                    warningaccount.append(tweet.username)
+                    other.remove(tweet.username)
                     continue
     spam = other
 
@@ -0,0 +1,127 @@
+"""
+module for detecting the language of tweets with polyglot
+"""
+import multiprocessing as mp
+import re
+from collections import OrderedDict
+
+import polyglot.detect
+
+
+def normalize(text, keyword=None):
+    """
+    removes the keyword from the text, the keyword is the same in every language and confuses the detector
+    :param text: text of the tweet
+    :param keyword: keyword the tweet was found with, optional
+    :return: text used for detection
+    """
+    if keyword:
+        return re.sub(keyword, '', text)
+    return text
+
+
+def detect(text):
+    """
+    detects the language of a normalized text
+    :param text: normalized text
+    :return: name of the language or None if the text is too short or mixed to be sure
+    """
+    try:
+        return polyglot.detect.Detector(re.sub('#', '', text)).language.name
+    except polyglot.detect.base.UnknownLanguage:
+        return None
+    except:
+        try:
+            return polyglot.detect.Detector(''.join([i if ord(i) < 128 else ' ' for i in text])).language.name
+        except polyglot.detect.base.UnknownLanguage:
+            return None
+
+
+class LanguageDetector(object):
+    """
+    detects languages of tweets and remembers the results by text and by user
+    """
+    def __init__(self, size=100000):
+        """
+        constructor for LanguageDetector
+        :param size: maximum amount of texts and users that are remembered
+        :return: None
+        """
+        self.size = size
+        self.texts = OrderedDict()
+        self.users = OrderedDict()
+
+    def _remember(self, cache, key, value):
+        """
+        stores value in cache, the least recently used entry is dropped when the cache is full
+        :param cache: OrderedDict that is used as cache
+        :param key: key of the value
+        :param value: value to be stored
+        :return: None
+        """
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > self.size:
+            cache.popitem(last=False)
+
+    def _resolve(self, key, language, username):
+        """
+        stores a detection result and turns it into the language of the tweet
+        :param key: hash of the normalized text
+        :param language: detected language or None
+        :param username: name of the sender, optional
+        :return: name of the language, the language the user usually writes in or "mixed" if it is not known
+        """
+        self._remember(self.texts, key, language)
+        if language is not None:
+            if username is not None:
+                self._remember(self.users, username, language)
+            return language
+        return self.users.get(username, "mixed")
+
+    def detect(self, text, keyword=None, username=None):
+        """
+        detects the language of a single text
+        :param text: text of the tweet
+        :param keyword: keyword the tweet was found with, optional
+        :param username: name of the sender, optional
+        :return: name of the language
+        """
+        normalized = normalize(text, keyword)
+        key = hash(normalized)
+        if key in self.texts:
+            language = self.texts[key]
+        else:
+            language = detect(normalized)
+        return self._resolve(key, language, username)
+
+    def detect_many(self, tweets, processes=None):
+        """
+        detects the language of all tweets that do not have one yet, unknown texts are spread over a process pool
+        :param tweets: list of tweets
+        :param processes: amount of processes, if left empty the amount of cpus is used
+        :return: None
+        """
+        todo = []
+        unknown = OrderedDict()
+        for tweet in tweets:
+            if tweet.has_language():
+                continue
+            text = normalize(tweet.text, tweet.get_keyword())
+            key = hash(text)
+            todo.append((tweet, key))
+            if key not in self.texts:
+                unknown[key] = text
+        texts = list(unknown.values())
+        if len(texts) < 1000:
+            languages = [detect(text) for text in texts]
+        else:
+            with mp.Pool(processes) as pool:
+                languages = pool.map(detect, texts, chunksize=250)
+        detected = dict(zip(unknown.keys(), languages))
+        for tweet, key in todo:
+            language = detected[key] if key in detected else self.texts.get(key)
+            tweet.language = self._resolve(key, language, tweet.username)
+
+
+DETECTOR = LanguageDetector()
@@ -1,17 +1,19 @@
 """Starter script for the FloodFilter algorithm"""
 import argparse
-import datetime
 import logging
 import os
 from multiprocessing.pool import ThreadPool
 
 import floodtags.core.dependencyinjection as di
 import floodtags.datascience.newspipeline
+from floodtags.core.pipeline import Pipeline
 from floodtags.core.statics import StaticData
+from floodtags.datascience.frame import TweetFrame
+from floodtags.linguistics.language.detection import DETECTOR
 from floodtags.linguistics.sanitizing.regexhandler import Expressions
 
 
-def main(input, location, type, proc, loop, timeframe):
+def main(input, location, type, proc, loop, timeframe, fetchers=1, spool=None, replay=None):
     """
     Main part of the program
     :param input: input source can be a file or a stream or demo
@@ -19,15 +21,21 @@ def main(input, location, type, proc, loop, timeframe):
     :param type: type of output
     :param proc: amount of processes used
     :param loop: amount of times the algorithm is repeated
+    :param timeframe: time frame used for clustering in minutes
+    :param fetchers: amount of API pages requested at the same time
+    :param spool: directory where fetched API pages are stored, optional
+    :param replay: speed up for replaying the demo or a file as a stream (1, 10, 100 or "max"), optional
     :return: None
     """
     if loop == "infinite":
         loop = float("inf")
+    else:
+        loop = int(loop)
 
     container = di.Container()
     regex = container.create("regex")
     file = False
-    if regex.exists(input, Expressions.file):
+    if regex.exists(input, Expressions.file) and not replay:
         file = True
     logging.disable(logging.WARNING)
 
@@ -35,13 +43,21 @@ def main(input, location, type, proc, loop, timeframe):
     container.set_location(location)
     container.set_type(type)
     container.set_proc(proc)
+    container.set_fetchers(fetchers)
+    if spool:
+        container.set_spool(spool)
+    if replay:
+        container.set_replay(replay)
     handler = container.create("handler")
     totaltweets = []
     # while there are not enough tweets
     while len(totaltweets) < 5000:
-        # get tweets
-        totaltweets += handler.get_tweets()
-        if file:
+        # get tweets, start as soon as there are enough, the rest is picked up in the next fetch
+        for batch in handler.stream_tweets():
+            totaltweets += batch
+            if len(totaltweets) >= 5000 and not file:
+                break
+        if file or (replay and handler.api.is_finished()):
             break
     # analyse tweets
     analysis = container.create("analysis")
@@ -53,7 +69,7 @@ def main(input, location, type, proc, loop, timeframe):
     # set language for NER if not english
     content = []
     for tweet in totaltweets:
-        content.append(tweet.tweet["text"])
+        content.append(tweet.text)
 
     if language != "English":
         print(language)
@@ -72,41 +88,73 @@ def main(input, location, type, proc, loop, timeframe):
     print("language specific files found:", lang)
 
     userblacklist = container.create("bannedusers")
-    tweets = [tweet for tweet in totaltweets if not userblacklist.match(tweet.tweet["source"]["username"])]
-    temp = [tweet for tweet in tweets if not regex.exists(tweet.tweet["text"], Expressions.falsealarm)]
+    tweets = [tweet for tweet in totaltweets if not userblacklist.match(tweet.username)]
+    temp = [tweet for tweet in tweets if not regex.exists(tweet.text, Expressions.falsealarm)]
     tweets = temp
     if lang:
         container.set_language(language.lower())
         blacklist = container.create("blacklist")
-        tweets = [tweet for tweet in tweets if not blacklist.match(tweet.tweet["text"])]
+        tweets = [tweet for tweet in tweets if not blacklist.match(tweet.text)]
         newslist = container.create("newsaccounts")
         warnlist = container.create("warnlist")
 
-    index = 0
+    newspool = ThreadPool(processes=1)
 
-    while True:
+    def ingest():
+        """
+        yields the new tweets once per window, the tweets of the startup are already in totaltweets
+        :return: generator of lists of tweets, None for the first window
+        """
+        yield None
+        index = 0
+        while index < loop and not (replay and handler.api.is_finished()):
+            index += 1
+            new = handler.get_tweets()
+            if replay:
+                print("replay lag:", round(handler.api.get_lag(), 1), "seconds")
+            yield new
+
+    def prepare(new):
+        """
+        adds new tweets, applies the blacklists and selects the window
+        :param new: list of new tweets or None for the first window
+        :return: tuple (all tweets, filtered tweets, window, result of the news analysis or None)
+        """
+        nonlocal tweets
+        if new is not None:
+            totaltweets.extend(new)
+            # apply blacklist
+            tweets = [tweet for tweet in totaltweets if not userblacklist.match(tweet.username)]
+            if lang:
+                tweets = [tweet for tweet in tweets if not blacklist.match(tweet.text)]
+        async_result = None
         if not file:
-            maxdate = datetime.datetime.strptime("1900-01-01T00:00:00.000Z", "%Y-%m-%dT%H:%M:%S.000Z")
-            for tweet in tweets:
-                if maxdate < tweet.date:
-                    maxdate = tweet.date
-
-            timedselection = [x for x in tweets if x.date > (maxdate - datetime.timedelta(minutes=int(timeframe)))]
+            frame = TweetFrame(tweets)
+            # the window is a view on the frame, rows are sorted on date
+            timedselection = frame.window(int(timeframe)).tweets
             if lang:
-                pool = ThreadPool(processes=1)
-                async_result = pool.apply_async(floodtags.datascience.newspipeline.frequent_tweeter_analysis,
-                                                (tweets, newslist, warnlist))
+                async_result = newspool.apply_async(floodtags.datascience.newspipeline.frequent_tweeter_analysis,
+                                                    (frame, newslist, warnlist))
         else:
             timedselection = tweets
+        return list(totaltweets), tweets, timedselection, async_result
+
+    def analyse(job):
+        """
+        clusters the window and orders the clusters
+        :param job: result of prepare
+        :return: tuple (all tweets, filtered tweets, clusters, order, news accounts)
+        """
+        originals, selected, timedselection, async_result = job
+        # detect the languages of the window at once, otherwise every clustering process detects them again
+        DETECTOR.detect_many(timedselection, int(proc))
         # cluster + spamfilter -- if language exists otherwise skip spamfilter
-
-
         clustering = container.create("clustering")
         clustering.set_data(timedselection)
 
         clusters = clustering.start_algorithm()
 
-        if not file and lang:
+        if async_result is not None:
             newsaccounts, warnaccounts, spam = async_result.get()
             for account in spam:
                 userblacklist.append(account)
@@ -117,29 +165,34 @@ def main(input, location, type, proc, loop, timeframe):
         filtering = container.create("filtering")
         filtering.set_data(clusters)
         order = filtering.start_filtering()
-
-        # write results
+        return originals, selected, clusters, order, newsaccounts
+
+    def output(result):
+        """
+        writes the results of a window
+        :param result: result of analyse
+        :return: None
+        """
+        originals, selected, clusters, order, newsaccounts = result
         writer = container.create("outputformatter")
-        writer.set_original_tweets(totaltweets)
-        writer.set_tweets(tweets)
+        writer.set_original_tweets(originals)
+        writer.set_tweets(selected)
         writer.set_clusters(clusters, order)
         writer.set_newsaccounts(newsaccounts)
         writer.set_locations(StaticData.locations)
         writer.output_result()
+        if loop > 0:
+            print("queue depths:", dict(pipeline.queue_depths()))
 
-        # if event is over -- what condition? shutdown file from webapp?
-        # break
-        if int(index) >= int(loop):
-            return
-        else:
-            index += 1
-
-        # get tweets
-        totaltweets += handler.get_tweets()
-        # apply blacklist
-        tweets = [tweet for tweet in totaltweets if not userblacklist.match(tweet.tweet["source"]["username"])]
-        if lang:
-            tweets = [tweet for tweet in tweets if not blacklist.match(tweet.tweet["text"])]
+    # the next window is fetched and prepared while the current one is clustered and written
+    pipeline = Pipeline()
+    pipeline.add_stage("prepare", prepare)
+    pipeline.add_stage("analysis", analyse)
+    pipeline.add_stage("output", output)
+    try:
+        pipeline.run(ingest())
+    finally:
+        newspool.close()
 
 
 if __name__ == '__main__':
@@ -164,6 +217,13 @@ if __name__ == '__main__':
                         help="amount of times the algorithm loops; integer value or \"infinite\" (default:0)")
     parser.add_argument("-tf", "-timeframe", dest="timeframe", default=360,
                         help="time frame, used for clustering tweets, in minutes")
+    parser.add_argument("-f", "--fetchers", dest="fetchers", default=1,
+                        help="amount of API pages requested at the same time (default: 1)")
+    parser.add_argument("-s", "--spool", dest="spool", default=None,
+                        help="directory where fetched API pages are stored so a restart can resume from them")
+    parser.add_argument("-r", "--replay", dest="replay", default=None,
+                        help="replay demo or a file as a stream at this speed up; 1, 10, 100 or \"max\"")
 
     args = parser.parse_args()
-    main(args.input, args.loc, args.type, args.proc, args.loop, args.timeframe)
+    main(args.input, args.loc, args.type, args.proc, args.loop, args.timeframe, args.fetchers, args.spool,
+         args.replay)
@@ -0,0 +1,42 @@
+import json
+import os
+import tempfile
+import unittest
+
+from floodtags.api.corpus import PackedCorpus, pack
+
+
+class BasicTestSuite(unittest.TestCase):
+    """Basic test cases."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.files = {0: [{"id": "a", "text": "flood"}, {"id": "b", "text": "banjir ☔"}],
+                      2: [{"id": "c", "text": "overstroming"}]}
+        for number, tags in self.files.items():
+            with open(os.path.join(self.directory.name, "data" + str(number) + ".json"), "w", encoding="utf8") as f:
+                json.dump(tags, f)
+        self.path = os.path.join(self.directory.name, "corpus.pack")
+        pack(self.directory.name, self.path)
+        self.corpus = PackedCorpus(self.path)
+
+    def tearDown(self):
+        self.corpus.close()
+        self.directory.cleanup()
+
+    def test_files(self):
+        self.assertEqual(3, len(self.corpus))
+        self.assertEqual(self.files[0], self.corpus.get_file(0))
+        self.assertEqual([], self.corpus.get_file(1))
+        self.assertEqual(self.files[2], self.corpus.get_file(2))
+
+    def test_records(self):
+        self.assertEqual([self.files[0][1], self.files[2][0]], self.corpus.get_records(1, 3))
+
+    def test_missing_file(self):
+        with self.assertRaises(IndexError):
+            self.corpus.get_file(3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+
+from floodtags.api.dedup import BloomFilter, SeenIds
+
+
+class BasicTestSuite(unittest.TestCase):
+    """Basic test cases."""
+
+    def test_bloom(self):
+        bloom = BloomFilter(1000, 0.01)
+        for i in range(1000):
+            bloom.add(str(i))
+        self.assertTrue(all(str(i) in bloom for i in range(1000)))
+        false_positives = sum(str(i) in bloom for i in range(1000, 11000))
+        self.assertLess(false_positives, 300)
+        self.assertTrue(bloom.is_full())
+
+    def test_seen(self):
+        seen = SeenIds(window=10, capacity=50, filters=2)
+        tags = [{"source": {"id": str(i % 30)}} for i in range(60)]
+        self.assertEqual(30, len(seen.filter(tags)))
+        self.assertEqual(30, seen.duplicates)
+        # the oldest ids have moved to a bloom filter but are still known
+        self.assertEqual(1, len(seen.blooms))
+        self.assertTrue("0" in seen)
+        self.assertTrue(seen.add("new"))
+        self.assertFalse(seen.add("new"))
+
+    def test_bounded(self):
+        seen = SeenIds(window=10, capacity=20, filters=2)
+        for i in range(200):
+            seen.add(str(i))
+        self.assertEqual(2, len(seen.blooms))
+        self.assertLessEqual(len(seen.current) + len(seen.previous), 20)
+
+
+if __name__ == '__main__':
+    unittest.main()
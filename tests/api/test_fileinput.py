@@ -0,0 +1,47 @@
+import gzip
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from floodtags.api.fileinput import TagReader, iter_tags
+
+
+class BasicTestSuite(unittest.TestCase):
+    """Basic test cases."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.tags = [{"id": str(i), "text": "flood " * i, "count": 10 ** i} for i in range(25)]
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_tags_layout(self):
+        document = json.dumps({"total": 12345, "meta": {"a": [1, 2]}, "tags": self.tags, "next": None}, indent=2)
+        # tiny chunks force values to be split over several reads
+        self.assertEqual(self.tags, list(TagReader(io.StringIO(document), chunk_size=7).tags()))
+
+    def test_array_layout(self):
+        self.assertEqual(self.tags, list(TagReader(io.StringIO(json.dumps(self.tags)), chunk_size=5).tags()))
+        self.assertEqual([], list(TagReader(io.StringIO('{"tags": []}')).tags()))
+
+    def test_batches(self):
+        path = os.path.join(self.directory, "tags.json")
+        with open(path, "w", encoding="utf8") as data_file:
+            json.dump({"tags": self.tags}, data_file)
+        batches = list(iter_tags(path, 10))
+        self.assertEqual([10, 10, 5], [len(batch) for batch in batches])
+        self.assertEqual(self.tags, [tag for batch in batches for tag in batch])
+
+    def test_ndjson_gzip(self):
+        path = os.path.join(self.directory, "tags.ndjson.gz")
+        with gzip.open(path, "wt", encoding="utf8") as data_file:
+            data_file.write("\n".join(json.dumps(tag) for tag in self.tags) + "\n\n")
+        self.assertEqual(self.tags, [tag for batch in iter_tags(path, 4) for tag in batch])
+
+
+if __name__ == '__main__':
+    unittest.main()
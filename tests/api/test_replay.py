@@ -0,0 +1,56 @@
+import unittest
+
+from floodtags.api.replay import Timeline
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def tag(minute, second=0):
+    return {"id": str(minute) + ":" + str(second), "date": "2016-01-01T10:%02d:%02d.000Z" % (minute, second)}
+
+
+class BasicTestSuite(unittest.TestCase):
+    """Basic test cases."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.tags = [tag(5), tag(0), tag(0, 30), tag(10)]
+
+    def test_speed(self):
+        timeline = Timeline(self.tags, 60, self.clock, self.clock.sleep)
+        self.assertEqual(["0:0"], [t["id"] for t in timeline.take()])
+        # 30 stream seconds are half a wall clock second at 60x
+        self.clock.now += 0.5
+        self.assertEqual(["0:30"], [t["id"] for t in timeline.take()])
+        # nothing is due, take waits for the next tag
+        self.assertEqual(["5:0"], [t["id"] for t in timeline.take()])
+        self.assertEqual(1005.0, self.clock.now)
+        self.assertEqual(0, timeline.get_lag())
+        self.assertFalse(timeline.is_finished())
+
+    def test_lag(self):
+        timeline = Timeline(self.tags, 60, self.clock, self.clock.sleep)
+        timeline.take()
+        self.clock.now += 12
+        self.assertEqual(["0:30", "5:0", "10:0"], [t["id"] for t in timeline.take()])
+        self.assertAlmostEqual(11.5, timeline.get_lag())
+        self.assertTrue(timeline.is_finished())
+        self.assertEqual([], timeline.take())
+
+    def test_max(self):
+        timeline = Timeline(self.tags, "max", self.clock, self.clock.sleep)
+        self.assertEqual(4, len(timeline.take()))
+        self.assertEqual(1000.0, self.clock.now)
+
+
+if __name__ == '__main__':
+    unittest.main()
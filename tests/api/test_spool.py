@@ -0,0 +1,71 @@
+import datetime
+import json
+import tempfile
+import unittest
+import urllib.error
+
+import floodtags.api.crawler as crawler
+from floodtags.api.spool import PageSpool
+
+
+class PageServer(object):
+    """serves pages of fake tags, can be made to fail after a number of pages"""
+
+    def __init__(self, amount, fail_after=None):
+        self.size = 2
+        self.tags = [{"id": str(i)} for i in range(amount)]
+        self.fail_after = fail_after
+        self.requested = []
+
+    def get_many(self, paths):
+        result = []
+        for path in paths:
+            if self.fail_after is not None and len(self.requested) >= self.fail_after:
+                raise urllib.error.HTTPError(path, 500, "error", None, None)
+            skip = int(path.rsplit("skip=", 1)[1])
+            self.requested.append(skip)
+            result.append(json.dumps({"tags": self.tags[skip:skip + crawler.PAGE_SIZE]}))
+        return result
+
+
+class BasicTestSuite(unittest.TestCase):
+    """Basic test cases."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.spool = PageSpool(self.directory.name)
+        self.start = datetime.datetime(2016, 4, 17, 12, 0, 0, 123456)
+        self.end = datetime.datetime(2016, 4, 18, 12, 0, 0)
+        self.config = crawler.APIConfig()
+        self.config.set_api_key("test")
+        self.config.set_start_time(self.start)
+        self.config.set_end_time(self.end)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def fetch(self, server):
+        spool_range = self.spool.open_range("flood", self.start, self.end)
+        return crawler.FetchTweets(self.config, server, spool_range, crawler.Backoff(budget=0)).fetch()
+
+    def test_cursor(self):
+        self.spool.set_cursor("flood", self.start, self.end, 300)
+        cursor = self.spool.get_cursor("flood")
+        self.assertEqual((self.start, self.end, 300, False),
+                         (cursor["since"], cursor["until"], cursor["skip"], cursor["complete"]))
+
+    def test_resume(self):
+        with self.assertRaises(urllib.error.HTTPError):
+            self.fetch(PageServer(450, fail_after=2))
+        self.assertEqual(200, self.spool.get_cursor("flood")["skip"])
+
+        server = PageServer(450)
+        result = self.fetch(server)
+        self.assertEqual([str(i) for i in range(450)], [tag["id"] for tag in result])
+        self.assertEqual([200, 300, 400, 500], server.requested)
+        self.assertTrue(self.spool.get_cursor("flood")["complete"])
+        self.assertEqual(result, self.spool.load_completed("flood"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import threading
+import unittest
+
+from floodtags.core.pipeline import Pipeline
+
+
+class BasicTestSuite(unittest.TestCase):
+    """Basic test cases."""
+
+    def test_order(self):
+        results = []
+        pipeline = Pipeline()
+        pipeline.add_stage("double", lambda x: x * 2)
+        pipeline.add_stage("odd", lambda x: x if x % 4 else None)
+        pipeline.add_stage("output", results.append)
+        pipeline.run(range(10))
+        self.assertEqual([2, 6, 10, 14, 18], results)
+        self.assertEqual([10, 10, 5], [stage.processed for stage in pipeline.stages])
+
+    def test_overlap(self):
+        # the source keeps producing while the last stage is blocked
+        release = threading.Event()
+        produced = []
+        depths = []
+
+        def source():
+            for i in range(3):
+                produced.append(i)
+                if i == 2:
+                    depths.append(pipeline.queue_depths()["wait"])
+                    release.set()
+                yield i
+
+        pipeline = Pipeline()
+        pipeline.add_stage("wait", lambda x: release.wait())
+        pipeline.run(source())
+        self.assertEqual([0, 1, 2], produced)
+        self.assertEqual([1], depths)
+
+    def test_error(self):
+        def fail(x):
+            if x == 3:
+                raise ValueError("stage failed")
+            return x
+
+        pipeline = Pipeline()
+        pipeline.add_stage("fail", fail)
+        pipeline.add_stage("output", lambda x: None)
+        self.assertRaises(ValueError, pipeline.run, range(100))
+
+
+if __name__ == '__main__':
+    unittest.main()
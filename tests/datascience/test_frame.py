@@ -0,0 +1,48 @@
+import unittest
+
+from floodtags.datascience.frame import TweetFrame
+
+
+class FakeTweet(object):
+    def __init__(self, date, username, keyword="flood", language=None):
+        self.date = date
+        self.username = username
+        self.keywords = (keyword,) if keyword else ()
+        self.language = language
+
+    def has_language(self):
+        return self.language is not None
+
+    def get_keyword(self):
+        return self.keywords[0] if self.keywords else None
+
+
+class BasicTestSuite(unittest.TestCase):
+    """Basic test cases."""
+
+    def setUp(self):
+        self.frame = TweetFrame([FakeTweet(300, "a", language="English"), FakeTweet(100, "b", "banjir"),
+                                 FakeTweet(200, "a", language="English")])
+        self.frame.extend([FakeTweet(400, "c", "banjir", "Indonesian"), FakeTweet(50, "a", None)])
+
+    def test_sorted(self):
+        self.assertEqual([50, 100, 200, 300, 400], list(self.frame.dates))
+        self.assertEqual(400, self.frame.max_date())
+
+    def test_window(self):
+        window = self.frame.window(4)
+        self.assertEqual([200, 300, 400], [tweet.date for tweet in window])
+        self.assertTrue(window.dates.base is not None)
+
+    def test_user_counts(self):
+        self.assertEqual({"a": 3, "b": 1, "c": 1}, self.frame.user_counts())
+        self.assertEqual({"a": 2, "c": 1}, self.frame.window(4).user_counts())
+
+    def test_majority(self):
+        self.assertEqual("English", self.frame.majority_language())
+        self.assertEqual("flood", self.frame.majority_keyword())
+        self.assertEqual("banjir", self.frame.window(1).majority_keyword())
+
+
+if __name__ == '__main__':
+    unittest.main()